@@ -10,15 +10,194 @@ files for Claude Code to process.
 All Watchers follow this pattern:
 1. check_for_updates() - Return list of new items to process
 2. create_action_file() - Create .md file in Needs_Action folder
+   (create_action_files() handles a whole batch; override it for bulk APIs)
 3. run() - Infinite loop with configurable check interval
 """
 
-import time
+import os
+import json
+import queue
 import logging
+from logging.handlers import TimedRotatingFileHandler
 from pathlib import Path
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Any, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Hashable, List, Any, Optional
+
+try:
+    import orjson as _json_fast
+except ImportError:
+    _json_fast = None
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.observers.polling import PollingObserver
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    # watchdog is optional here: without it, run() falls back to plain polling
+    Observer = PollingObserver = None
+    FileSystemEventHandler = object
+
+
+# Shared by every console and file handler (formatters are stateless)
+LOG_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+
+def setup_logging(name: str, log_file: Path) -> logging.Logger:
+    """
+    Setup a logger writing to both console and a midnight-rotating file.
+    
+    Args:
+        name: Logger name
+        log_file: Path of the log file (dated backups are kept alongside)
+        
+    Returns:
+        Configured logger
+    """
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.INFO)
+    
+    # Console handler
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.INFO)
+    console_handler.setFormatter(LOG_FORMATTER)
+    logger.addHandler(console_handler)
+    
+    # File handler (daily rotating log, rolled over at midnight)
+    try:
+        file_handler = TimedRotatingFileHandler(
+            log_file, when='midnight', backupCount=30, encoding='utf-8'
+        )
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(LOG_FORMATTER)
+        logger.addHandler(file_handler)
+    except Exception as e:
+        logger.warning(f"Could not create log file: {e}")
+    
+    return logger
+
+
+# Filesystems where inotify/FSEvents miss remote changes, so we must poll
+NETWORK_FS_TYPES = {'nfs', 'nfs4', 'cifs', 'smbfs', 'smb3', 'fuse.sshfs', '9p', 'afs'}
+
+
+def is_network_fs(path: Path) -> bool:
+    """Return True if path lives on a network filesystem (Linux /proc/mounts)."""
+    try:
+        with open('/proc/mounts') as f:
+            mounts = [line.split()[1:3] for line in f]
+    except OSError:
+        return False
+    
+    target = str(Path(path).resolve())
+    best_mount, fs_type = '', ''
+    for mount_point, mount_type in mounts:
+        mount_point = mount_point.replace('\\040', ' ')
+        prefix = mount_point.rstrip('/') + '/'
+        if (target == mount_point or target.startswith(prefix)) and len(mount_point) > len(best_mount):
+            best_mount, fs_type = mount_point, mount_type
+    return fs_type in NETWORK_FS_TYPES
+
+
+class BoundedSeen:
+    """
+    Set of seen keys that forgets the least recently used past maxlen.
+    
+    Membership tests count as a use, so keys that keep turning up stay.
+    """
+    
+    def __init__(self, maxlen: int = 100_000):
+        self.maxlen = maxlen
+        self._keys: OrderedDict[Hashable, None] = OrderedDict()
+    
+    def __contains__(self, key: Hashable) -> bool:
+        if key in self._keys:
+            self._keys.move_to_end(key)
+            return True
+        return False
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    def __iter__(self):
+        return iter(self._keys)
+    
+    def add(self, key: Hashable):
+        self._keys[key] = None
+        self._keys.move_to_end(key)
+        if len(self._keys) > self.maxlen:
+            self._keys.popitem(last=False)
+    
+    def discard(self, key: Hashable):
+        self._keys.pop(key, None)
+
+
+class QueueEventHandler(FileSystemEventHandler):
+    """Handler that pushes created/moved file paths onto a queue."""
+    
+    def __init__(self, events: queue.Queue):
+        self.events = events
+    
+    def on_created(self, event):
+        if not event.is_directory:
+            self.events.put(Path(event.src_path))
+    
+    def on_moved(self, event):
+        if not event.is_directory:
+            self.events.put(Path(event.dest_path))
+
+
+def make_observer(paths: List[Path], polling_interval: float):
+    """
+    Create (but don't start) the watchdog observer suited to paths.
+    
+    Uses the native observer (inotify/FSEvents/ReadDirectoryChangesW) on local
+    filesystems and a PollingObserver when any path is on a network mount.
+    """
+    if any(is_network_fs(p) for p in paths):
+        return PollingObserver(timeout=polling_interval)
+    return Observer()
+
+
+def start_observer(paths: List[Path], events: queue.Queue, polling_interval: float):
+    """
+    Start a watchdog observer (see make_observer) feeding file events into a queue.
+    
+    Returns:
+        The started observer, or None if watchdog is unavailable or no paths given
+    """
+    if Observer is None or not paths:
+        return None
+    
+    observer = make_observer(paths, polling_interval)
+    handler = QueueEventHandler(events)
+    for path in paths:
+        observer.schedule(handler, str(path), recursive=False)
+    observer.start()
+    return observer
+
+
+def wait_for_events(events: queue.Queue, timeout: float) -> List[Path]:
+    """
+    Block until a file event arrives or timeout expires, then drain the queue.
+    
+    Returns:
+        List of event paths (empty on a keepalive timeout)
+    """
+    try:
+        paths = [events.get(timeout=timeout)]
+    except queue.Empty:
+        return []
+    while True:
+        try:
+            paths.append(events.get_nowait())
+        except queue.Empty:
+            return paths
 
 
 class BaseWatcher(ABC):
@@ -30,6 +209,9 @@ class BaseWatcher(ABC):
     - create_action_file(item): Create .md file in Needs_Action folder
     """
     
+    # Characters that are invalid in filenames, mapped to '_'
+    _SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+    
     def __init__(self, vault_path: str, check_interval: int = 60):
         """
         Initialize the Watcher.
@@ -61,58 +243,54 @@ class BaseWatcher(ABC):
     
     def _setup_logging(self) -> logging.Logger:
         """Setup logging to both file and console."""
-        logger = logging.getLogger(self.__class__.__name__)
-        logger.setLevel(logging.INFO)
-        
-        # Console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-        console_format = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        console_handler.setFormatter(console_format)
-        logger.addHandler(console_handler)
-        
-        # File handler (daily rotating log)
-        log_file = self.logs / f'watcher_{datetime.now().strftime("%Y-%m-%d")}.log'
-        try:
-            file_handler = logging.FileHandler(log_file)
-            file_handler.setLevel(logging.DEBUG)
-            file_format = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
-            file_handler.setFormatter(file_format)
-            logger.addHandler(file_handler)
-        except Exception as e:
-            logger.warning(f"Could not create log file: {e}")
-        
-        return logger
+        # One file per watcher class: rotating handlers in separate processes
+        # must not share a file, or each rollover clobbers the others'
+        name = self.__class__.__name__
+        return setup_logging(name, self.logs / f'{name}.log')
     
     def _load_state(self):
         """Load processed IDs from state file for persistence."""
-        import json
         if self.state_file.exists():
             try:
                 with open(self.state_file, 'r') as f:
                     state = json.load(f)
                     self.processed_ids = set(state.get('processed_ids', []))
+                self._restore_state(state)
                 self.logger.info(f"Loaded state: {len(self.processed_ids)} processed IDs")
             except Exception as e:
                 self.logger.warning(f"Could not load state: {e}")
     
     def _save_state(self):
-        """Save processed IDs to state file."""
-        import json
+        """Save processed IDs to state file (atomically, so a crash can't corrupt it)."""
         try:
             # Only keep last 1000 IDs to prevent unbounded growth
             ids_list = list(self.processed_ids)[-1000:]
-            with open(self.state_file, 'w') as f:
-                json.dump({'processed_ids': ids_list}, f)
+            state = {'processed_ids': ids_list, **self._extra_state()}
+            if _json_fast:
+                data = _json_fast.dumps(state)
+            else:
+                data = json.dumps(state).encode('utf-8')
+            
+            tmp_file = self.state_file.with_suffix('.json.tmp')
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, self.state_file)
         except Exception as e:
             self.logger.warning(f"Could not save state: {e}")
     
+    def _extra_state(self) -> dict:
+        """
+        Extra fields to persist alongside processed IDs.
+        
+        Subclasses override this together with _restore_state(). Note that
+        _load_state() runs inside __init__, so attributes it restores into
+        must be created before calling super().__init__().
+        """
+        return {}
+    
+    def _restore_state(self, state: dict):
+        """Restore the extra fields written by _extra_state()."""
+        pass
+    
     @abstractmethod
     def check_for_updates(self) -> List[Any]:
         """
@@ -136,26 +314,61 @@ class BaseWatcher(ABC):
         """
         pass
     
+    def create_action_files(self, items: List[Any]) -> List[Path]:
+        """
+        Create action files for a batch of items.
+        
+        The default calls create_action_file() per item. Subclasses with a
+        bulk API or expensive per-call setup can override this to handle
+        the whole batch in one operation.
+        
+        Args:
+            items: Items returned from check_for_updates()
+            
+        Returns:
+            Paths of the files that were created
+        """
+        created = []
+        for item in items:
+            filepath = self.create_action_file(item)
+            if filepath:
+                created.append(filepath)
+        return created
+    
+    def get_watch_paths(self) -> List[Path]:
+        """
+        Local folders whose changes should wake the run loop early.
+        
+        Watchers backed by a folder override this; API-based watchers keep
+        the default and simply poll every check_interval seconds.
+        
+        Returns:
+            List of directories to observe
+        """
+        return []
+    
     def run(self):
         """
         Main run loop. Continuously checks for updates and creates action files.
         
-        This method runs indefinitely until interrupted (Ctrl+C).
+        Checks run whenever a watched folder changes, or every check_interval
+        seconds as a keepalive. This method runs indefinitely until interrupted (Ctrl+C).
         """
         self.logger.info(f"Starting {self.__class__.__name__}")
         self.logger.info(f"Vault path: {self.vault_path}")
         self.logger.info(f"Check interval: {self.check_interval}s")
         
+        events: queue.Queue = queue.Queue()
+        observer = start_observer(self.get_watch_paths(), events, self.check_interval)
+        
         try:
             while True:
                 try:
                     items = self.check_for_updates()
                     if items:
                         self.logger.info(f"Found {len(items)} new item(s)")
-                        for item in items:
-                            filepath = self.create_action_file(item)
-                            if filepath:
-                                self.logger.info(f"Created action file: {filepath.name}")
+                        for filepath in self.create_action_files(items):
+                            self.logger.info(f"Created action file: {filepath.name}")
                     
                     # Save state after each check
                     self._save_state()
@@ -163,8 +376,8 @@ class BaseWatcher(ABC):
                 except Exception as e:
                     self.logger.error(f"Error in check cycle: {e}", exc_info=True)
                 
-                # Wait before next check
-                time.sleep(self.check_interval)
+                # Wait for a file event or the next keepalive tick
+                wait_for_events(events, self.check_interval)
                 
         except KeyboardInterrupt:
             self.logger.info("Watcher stopped by user")
@@ -173,23 +386,28 @@ class BaseWatcher(ABC):
             self.logger.error(f"Fatal error: {e}", exc_info=True)
             self._save_state()
             raise
+        finally:
+            if observer:
+                observer.stop()
+                observer.join()
     
     def get_timestamp(self) -> str:
         """Get current timestamp in ISO format."""
         return datetime.now().isoformat()
     
-    def sanitize_filename(self, name: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def sanitize_filename(name: str) -> str:
         """
         Sanitize a string for use as a filename.
         
+        Pure function of name, so results are cached (not keyed by instance).
+        
         Args:
             name: Original name
             
         Returns:
             Sanitized filename-safe string
         """
-        # Remove or replace invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            name = name.replace(char, '_')
-        return name.strip()
+        # Replace invalid characters in a single pass
+        return name.translate(BaseWatcher._SANITIZE_TABLE).strip()
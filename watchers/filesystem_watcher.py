@@ -16,17 +16,145 @@ Or with default paths:
 
 import os
 import sys
+import errno
 import shutil
+import string
 import hashlib
 import time
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
-from watchdog.observers import Observer
+from typing import Dict, List, Optional, Tuple
 from watchdog.events import FileSystemEventHandler, FileCreatedEvent
 
+try:
+    import blake3
+except ImportError:
+    # Optional: fall back to hashlib's BLAKE2b with the same 256-bit digest
+    blake3 = None
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: no reflink ioctl, copies fall back to copy_file_range/shutil
+    fcntl = None
+
+try:
+    import liburing
+except ImportError:
+    # Optional, Linux only: batched hashing falls back to one file at a time
+    liburing = None
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:
+    # Linux only: other platforms keep using the watchdog observer
+    INotify = None
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
-from base_watcher import BaseWatcher
+from base_watcher import BaseWatcher, BoundedSeen, is_network_fs, make_observer
+
+
+# File extension -> file type category for action files
+FILE_TYPES = {
+    '.pdf': 'document',
+    '.doc': 'document',
+    '.docx': 'document',
+    '.txt': 'document',
+    '.md': 'document',
+    '.xls': 'spreadsheet',
+    '.xlsx': 'spreadsheet',
+    '.csv': 'spreadsheet',
+    '.jpg': 'image',
+    '.jpeg': 'image',
+    '.png': 'image',
+    '.gif': 'image',
+    '.zip': 'archive',
+    '.rar': 'archive',
+}
+
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# Action file written for each dropped file, see create_action_file()
+ACTION_TEMPLATE = string.Template("""---
+type: file_drop
+source: $source
+destination: $destination
+file_type: $file_type
+size: $size
+size_human: $size_human
+received: $timestamp
+priority: normal
+status: pending
+hash: $hash
+---
+
+# File Drop: $source
+
+A new file has been dropped for processing.
+
+## File Details
+
+- **Type**: $file_type
+- **Size**: $size_human
+- **Received**: $timestamp
+- **Location**: `$destination`
+
+## Suggested Actions
+
+- [ ] Review file content
+- [ ] Categorize appropriately
+- [ ] Take necessary action
+- [ ] Move to archive when complete
+
+## Notes
+
+<!-- Add notes about this file here -->
+
+---
+*Created by FileSystemWatcher*
+""")
+
+# Linux reflink ioctl, _IOW(0x94, 9, int): clone extents instead of copying data
+FICLONE = 0x40049409 if sys.platform.startswith('linux') else None
+
+SMALL_FILE_MAX = 1 << 20  # Files up to this size are hashed from one read
+
+# A drop counts as fully written once its size and mtime have been unchanged
+# for SETTLE_QUIET seconds; waits are capped at SETTLE_TIMEOUT
+SETTLE_QUIET = 0.5
+SETTLE_POLL = 0.1
+SETTLE_TIMEOUT = 10.0
+
+RECENT_DEST_WINDOW = 60.0  # Seconds a moved-in vault file is protected from overwrite
+
+DROP_POLL_INTERVAL = 1.0  # Seconds between polls when the drop folder is a network mount
+
+URING_DEPTH = 64  # Files hashed concurrently per io_uring batch
+URING_CHUNK = 64 * 1024  # Bytes per read submission
+
+
+def _write_bytes(path: Path, data: bytes, fsync: bool = False):
+    """Write data to path with one open and (normally) one write syscall."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_CLOEXEC', 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        if fsync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _new_hasher():
+    """Streaming hasher producing the same digest as _calculate_hash()."""
+    if blake3:
+        return blake3.blake3()
+    return hashlib.blake2b(digest_size=32)
 
 
 class FileDropHandler(FileSystemEventHandler):
@@ -44,12 +172,13 @@ class FileDropHandler(FileSystemEventHandler):
         source_path = Path(event.src_path)
         self.logger.info(f"File detected: {source_path.name}")
         
-        # Wait a moment for file to be fully written
-        import time
-        time.sleep(0.5)
+        # Wait until the file has stopped changing, i.e. has been fully written
+        st = self.watcher.wait_until_stable(source_path)
+        if st is None:
+            return
         
         # Process the file
-        self.watcher.process_file(source_path)
+        self.watcher.process_file(source_path, st)
 
 
 class FileSystemWatcher(BaseWatcher):
@@ -57,12 +186,13 @@ class FileSystemWatcher(BaseWatcher):
     Watcher that monitors a drop folder for new files.
     
     When a file is added to the drop folder, it:
-    1. Copies the file to the vault
+    1. Moves the file into the vault
     2. Creates a metadata .md file in Needs_Action
     3. Logs the action
     """
     
-    def __init__(self, vault_path: str, drop_folder: Optional[str] = None, check_interval: int = 30):
+    def __init__(self, vault_path: str, drop_folder: Optional[str] = None, check_interval: int = 30,
+                 require_hash: bool = False):
         """
         Initialize the File System Watcher.
         
@@ -70,7 +200,34 @@ class FileSystemWatcher(BaseWatcher):
             vault_path: Path to the Obsidian vault root directory
             drop_folder: Path to the folder to monitor (default: vault/Drop)
             check_interval: Seconds between checks (default: 30)
+            require_hash: Hash every drop, even when its size rules out a
+                duplicate (for audit-strict deployments)
         """
+        # Track file hashes to detect duplicates: raw 32-byte BLAKE3 digests,
+        # bounded so long-running watchers don't grow without limit
+        self.processed_hashes = BoundedSeen(maxlen=100_000)
+        
+        # (size, mtime_ns, inode) -> hash of files in the drop folder, so
+        # unchanged files are never re-read.
+        # Created before super().__init__() since it restores them from state.
+        self._seen_stat: Dict[Tuple[int, int, int], Optional[str]] = {}
+        
+        # size -> [(vault path, hash or None)] of processed files. A drop whose
+        # size matches nothing here can't be a duplicate, so it isn't hashed;
+        # the files in a bucket are hashed lazily on the first size collision.
+        self._seen_sizes: Dict[int, List[Tuple[Path, Optional[str]]]] = {}
+        
+        # Vault paths recently moved in -> monotonic time, see _dest_path()
+        self._recent_dests: Dict[Path, float] = {}
+        
+        self.require_hash = require_hash
+        
+        # Guards the dedupe state above: the watchdog handler and the periodic
+        # check call process_file() from different threads. Sources being
+        # processed are claimed so unhashed files can't be handled twice.
+        self._lock = threading.RLock()
+        self._claimed_sources: set = set()
+        
         super().__init__(vault_path, check_interval)
         
         # Setup drop folder
@@ -81,88 +238,567 @@ class FileSystemWatcher(BaseWatcher):
         
         self.drop_folder.mkdir(parents=True, exist_ok=True)
         
-        # Track file hashes to detect duplicates
-        self.processed_hashes: set = set()
+        # Action files are written off the event path by a background flusher.
+        # Durability is left to the OS unless fsync is requested.
+        self.fsync_action_files = False
+        self._action_q: queue.Queue = queue.Queue()
+        threading.Thread(target=self._action_flusher, daemon=True).start()
+        
+        # io_uring for batched hashing, with a read buffer per in-flight file
+        self._ring = self._setup_ring()
+        self._ring_buffers = [bytearray(URING_CHUNK) for _ in range(URING_DEPTH)] if self._ring else []
+        
+        # Without io_uring, batches are hashed in parallel; the pool size
+        # also caps how many files are mmap'd at once
+        self._hash_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1,
+                                             thread_name_prefix='hash')
+        self._hash_local = threading.local()
+        
+        # State is saved by a background thread whenever _dirty is set,
+        # rather than on a fixed timer
+        self._dirty = threading.Event()
+        self._stop = threading.Event()
+        self._saver: Optional[threading.Thread] = None
         
         self.logger.info(f"Drop folder: {self.drop_folder}")
     
+    def _setup_ring(self):
+        """Create the io_uring used by _hash_batch(), or None if unavailable."""
+        if liburing is None:
+            return None
+        try:
+            ring = liburing.Ring()
+            liburing.io_uring_queue_init(URING_DEPTH, ring)
+            return ring
+        except Exception as e:
+            self.logger.debug(f"io_uring unavailable, hashing files one at a time: {e}")
+            return None
+    
+    def _close_ring(self):
+        """Release the io_uring, if any."""
+        ring, self._ring = self._ring, None
+        if ring is not None:
+            liburing.io_uring_queue_exit(ring)
+    
     def _calculate_hash(self, filepath: Path) -> str:
-        """Calculate MD5 hash of a file."""
-        hash_md5 = hashlib.md5()
-        with open(filepath, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
-    
-    def check_for_updates(self) -> List[Path]:
+        """
+        Calculate BLAKE3 hash of a file (BLAKE2b-256 if blake3 is not installed).
+        
+        Files up to SMALL_FILE_MAX are read whole into the calling thread's
+        reusable buffer and hashed in one call, skipping mmap setup. Larger
+        files are mmap'd by blake3, or streamed through the same buffer.
+        """
+        buf = self._hash_buffer()
+        with open(filepath, "rb", buffering=0) as f:
+            if not blake3 or os.fstat(f.fileno()).st_size <= len(buf):
+                # Unbuffered readinto: no bytes object per read
+                file_hash = _new_hasher()
+                view = memoryview(buf)
+                while n := f.readinto(buf):
+                    file_hash.update(view[:n])
+                return file_hash.hexdigest()
+        
+        # mmap'd, SIMD and multithreaded for large files
+        file_hash = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        file_hash.update_mmap(filepath)
+        return file_hash.hexdigest()
+    
+    def _hash_buffer(self) -> bytearray:
+        """Reusable read buffer for the calling thread (not shared across threads)."""
+        buf = getattr(self._hash_local, 'buf', None)
+        if buf is None:
+            buf = self._hash_local.buf = bytearray(SMALL_FILE_MAX)
+        return buf
+    
+    def _hash_batch(self, paths: List[Path]) -> List[Optional[str]]:
+        """
+        Hash several files, overlapping the reads of small files through
+        io_uring when available and hashing the rest in parallel on a thread pool.
+        
+        Returns:
+            Hex digests in the same order as paths (None where a file couldn't be read)
+        """
+        if len(paths) < 2:
+            return [self._hash_one(filepath) for filepath in paths]
+        
+        if self._ring is None:
+            # hashlib and blake3 release the GIL while hashing, so threads scale
+            return list(self._hash_pool.map(self._hash_one, paths))
+        
+        # Only small files go through the ring; large ones are faster on the
+        # pool via blake3's multithreaded mmap path
+        small, large = [], []
+        for i, filepath in enumerate(paths):
+            try:
+                is_small = os.stat(filepath).st_size <= SMALL_FILE_MAX
+            except OSError:
+                is_small = False  # _hash_one() logs the error
+            (small if is_small else large).append(i)
+        
+        hashes: List[Optional[str]] = [None] * len(paths)
+        large_hashes = self._hash_pool.map(self._hash_one, [paths[i] for i in large])
+        for start in range(0, len(small), URING_DEPTH):
+            chunk = small[start:start + URING_DEPTH]
+            for i, file_hash in zip(chunk, self._hash_batch_uring([paths[i] for i in chunk])):
+                hashes[i] = file_hash
+        for i, file_hash in zip(large, large_hashes):
+            hashes[i] = file_hash
+        return hashes
+    
+    def _hash_one(self, filepath: Path) -> Optional[str]:
+        """Hash one file for _hash_batch(), logging instead of raising."""
+        try:
+            return self._calculate_hash(filepath)
+        except Exception as e:
+            self.logger.warning(f"Could not hash {filepath}: {e}")
+            return None
+    
+    def _hash_batch_uring(self, paths: List[Path]) -> List[Optional[str]]:
+        """
+        Hash up to URING_DEPTH files with one read in flight per file.
+        
+        Completions are reaped in bulk and the follow-up reads for all of them
+        go out in a single submit, so a batch costs a handful of syscalls.
+        """
+        ring = self._ring
+        cqe = liburing.Cqe()
+        fds, hashers, offsets = {}, {}, {}
+        hashes: List[Optional[str]] = [None] * len(paths)
+        
+        completed = False
+        
+        def submit_read(slot: int):
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_read(sqe, fds[slot], self._ring_buffers[slot], offsets[slot])
+            liburing.io_uring_sqe_set_data64(sqe, slot)
+        
+        try:
+            for slot, filepath in enumerate(paths):
+                try:
+                    fds[slot] = os.open(filepath, os.O_RDONLY | os.O_CLOEXEC)
+                except OSError as e:
+                    self.logger.warning(f"Could not hash {filepath}: {e}")
+                    continue
+                hashers[slot] = _new_hasher()
+                offsets[slot] = 0
+                submit_read(slot)
+            
+            in_flight = len(fds)
+            liburing.io_uring_submit(ring)
+            while in_flight:
+                liburing.io_uring_wait_cqe(ring, cqe)
+                while True:
+                    entry = cqe[0]
+                    res, slot = entry.res, entry.user_data
+                    liburing.io_uring_cqe_seen(ring, entry)
+                    
+                    if res < 0:
+                        self.logger.warning(f"Could not hash {paths[slot]}: {os.strerror(-res)}")
+                        in_flight -= 1
+                    elif res == 0:
+                        hashes[slot] = hashers[slot].hexdigest()
+                        in_flight -= 1
+                    else:
+                        hashers[slot].update(memoryview(self._ring_buffers[slot])[:res])
+                        offsets[slot] += res
+                        submit_read(slot)
+                    
+                    if not liburing.io_uring_cq_ready(ring):
+                        break
+                    liburing.io_uring_peek_cqe(ring, cqe)
+                liburing.io_uring_submit(ring)
+            completed = True
+        finally:
+            if not completed:
+                # Reads may still be in flight (or prepared but unsubmitted);
+                # replace the ring so they can't complete into the next batch.
+                # Exiting the ring waits for them before the fds are closed.
+                self._close_ring()
+                self._ring = self._setup_ring()
+            for fd in fds.values():
+                os.close(fd)
+        
+        return hashes
+    
+    def _extra_state(self) -> dict:
+        """Persist the stat fast-path cache and size index (last 1000 entries each)."""
+        # The saver thread runs alongside process_file()
+        with self._lock:
+            seen = list(self._seen_stat.items())[-1000:]
+            sizes = [[size, str(path), file_hash]
+                     for size, bucket in self._seen_sizes.items()
+                     for path, file_hash in bucket][-1000:]
+        return {
+            'seen_stat': [[*key, file_hash] for key, file_hash in seen],
+            'seen_sizes': sizes,
+        }
+    
+    def _restore_state(self, state: dict):
+        """Restore the stat fast-path cache, size index and the hashes they cover."""
+        for size, mtime_ns, inode, file_hash in state.get('seen_stat', []):
+            self._seen_stat[(size, mtime_ns, inode)] = file_hash
+            if file_hash:
+                self.processed_hashes.add(bytes.fromhex(file_hash))
+        for size, path, file_hash in state.get('seen_sizes', []):
+            self._seen_sizes.setdefault(size, []).append((Path(path), file_hash))
+            if file_hash:
+                self.processed_hashes.add(bytes.fromhex(file_hash))
+    
+    def _needs_hash(self, size: int) -> bool:
+        """Whether a drop of this size has to be hashed to rule out a duplicate."""
+        return self.require_hash or size in self._seen_sizes
+    
+    def _hash_size_buckets(self, sizes):
+        """Hash the not yet hashed processed files in these size buckets."""
+        pending, touched = [], set()
+        for size in set(sizes):
+            for i, (path, file_hash) in enumerate(self._seen_sizes.get(size, ())):
+                if file_hash is not None:
+                    continue
+                touched.add(size)
+                # A later drop with the same name may have replaced the file;
+                # a different size means it's not the file that was indexed
+                try:
+                    if os.stat(path).st_size == size:
+                        pending.append((size, i, path))
+                except OSError:
+                    pass
+        if not touched:
+            return
+        
+        hashes = self._hash_batch([path for _, _, path in pending])
+        for (size, i, path), file_hash in zip(pending, hashes):
+            self._seen_sizes[size][i] = (path, file_hash)
+            if file_hash:
+                self.processed_hashes.add(bytes.fromhex(file_hash))
+        
+        # Files moved out of the vault or replaced can't be compared against
+        for size in touched:
+            bucket = [entry for entry in self._seen_sizes[size] if entry[1] is not None]
+            if bucket:
+                self._seen_sizes[size] = bucket
+            else:
+                del self._seen_sizes[size]
+    
+    def _remember_size(self, size: int, dest_path: Path, file_hash: Optional[str]):
+        """Add a processed file to the size index, evicting the oldest size."""
+        self._seen_sizes.setdefault(size, []).append((dest_path, file_hash))
+        if len(self._seen_sizes) > 100_000:
+            del self._seen_sizes[next(iter(self._seen_sizes))]
+    
+    def check_for_updates(self) -> List[Tuple[Path, os.stat_result, Optional[str]]]:
         """
         Check for new files in the drop folder.
         
         Returns:
-            List of Path objects for new files
+            List of (path, stat result, hash) tuples for new files, so
+            process_file() doesn't need to stat or hash them again
+            (hash is None for files not hashed because of their unique size)
         """
+        with self._lock:
+            return self._check_for_updates()
+    
+    def _check_for_updates(self) -> List[Tuple[Path, os.stat_result, Optional[str]]]:
+        """check_for_updates() body, called with the lock held."""
         new_files = []
         
-        if not self.drop_folder.exists():
+        try:
+            it = os.scandir(self.drop_folder)
+        except FileNotFoundError:
             return new_files
         
-        for filepath in self.drop_folder.iterdir():
-            if filepath.is_file() and not filepath.name.startswith('.'):
-                # Calculate hash to check if already processed
+        # DirEntry caches its type from readdir, leaving one stat per file.
+        # The stat cache is rebuilt from what's still in the folder, so files
+        # that have been moved out don't accumulate in it.
+        candidates = []
+        seen_stat = {}
+        with it:
+            for entry in it:
+                if entry.name.startswith('.') or not entry.is_file(follow_symlinks=False):
+                    continue
                 try:
-                    file_hash = self._calculate_hash(filepath)
-                    if file_hash not in self.processed_hashes:
-                        new_files.append(filepath)
-                        self.processed_hashes.add(file_hash)
-                except Exception as e:
-                    self.logger.warning(f"Could not hash {filepath}: {e}")
+                    # Unchanged since a previous check: skip without reading it
+                    st = entry.stat(follow_symlinks=False)
+                    key = (st.st_size, st.st_mtime_ns, st.st_ino)
+                    if key in self._seen_stat:
+                        seen_stat[key] = self._seen_stat[key]
+                    else:
+                        candidates.append((Path(entry.path), st, key))
+                except OSError as e:
+                    self.logger.warning(f"Could not stat {entry.path}: {e}")
+        
+        pruned = len(seen_stat) != len(self._seen_stat)
+        self._seen_stat = seen_stat
+        
+        # A file whose size matches no processed file can't be a duplicate
+        # and is passed on unhashed; the rest are hashed in one batch
+        to_hash = [c for c in candidates if self._needs_hash(c[1].st_size)]
+        self._hash_size_buckets(st.st_size for _, st, _ in to_hash)
+        hashes = dict(zip((key for _, _, key in to_hash),
+                          self._hash_batch([filepath for filepath, _, _ in to_hash])))
         
+        for filepath, st, key in candidates:
+            if key in hashes:
+                file_hash = hashes[key]
+                if file_hash is None:
+                    continue
+                if bytes.fromhex(file_hash) in self.processed_hashes:
+                    self._seen_stat[key] = file_hash
+                    continue
+            else:
+                file_hash = None
+            self._seen_stat[key] = file_hash
+            new_files.append((filepath, st, file_hash))
+        
+        if candidates or pruned:
+            self._dirty.set()
         return new_files
     
-    def process_file(self, source_path: Path):
+    def process_file(self, source_path: Path, st: Optional[os.stat_result] = None,
+                     file_hash: Optional[str] = None):
         """
         Process a newly detected file.
         
         Args:
             source_path: Path to the source file
+            st: Stat result of the source file, if already known
+            file_hash: Hash of the source file, if already known
         """
-        try:
-            # Calculate hash
-            file_hash = self._calculate_hash(source_path)
-            
-            # Check if already processed
-            if file_hash in self.processed_hashes:
-                self.logger.info(f"File already processed: {source_path.name}")
+        # Skip files another thread is processing or has already moved
+        with self._lock:
+            if source_path in self._claimed_sources or not os.path.lexists(source_path):
                 return
+            self._claimed_sources.add(source_path)
+        
+        digest = None
+        entry = None
+        dest_path = None
+        try:
+            with self._lock:
+                if st is None:
+                    st = source_path.stat()
+                
+                # Only hash when another processed file has the same size
+                if file_hash is None and self._needs_hash(st.st_size):
+                    self._hash_size_buckets([st.st_size])
+                    if self._needs_hash(st.st_size):
+                        file_hash = self._calculate_hash(source_path)
+                
+                if file_hash is not None:
+                    # Check if already processed
+                    digest = bytes.fromhex(file_hash)
+                    if digest in self.processed_hashes:
+                        self.logger.info(f"File already processed: {source_path.name}")
+                        return
+                    
+                    # Claim the hash so the same content dropped twice
+                    # isn't processed twice
+                    self.processed_hashes.add(digest)
+                
+                # Create destination path
+                dest_path = self._dest_path(source_path.name)
+                dest_path.parent.mkdir(parents=True, exist_ok=True)
+                
+                # A same-name file is about to be overwritten: if it's indexed
+                # unhashed, hash it now while its bytes still exist
+                try:
+                    self._hash_size_buckets([os.stat(dest_path).st_size])
+                except FileNotFoundError:
+                    pass
+                
+                entry = (dest_path, file_hash)
+                self._remember_size(st.st_size, dest_path, file_hash)
             
-            # Create destination path
-            dest_path = self.vault_path / 'Files' / source_path.name
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Copy file
-            shutil.copy2(source_path, dest_path)
-            self.logger.info(f"Copied file to: {dest_path}")
+            # Move file into the vault (removes it from the drop folder)
+            self._move_file(source_path, dest_path, st)
+            self.logger.info(f"Moved file to: {dest_path}")
             
-            # Create action file
-            self.create_action_file({
+            # Queue the action file; the flusher thread writes it
+            self._action_q.put({
                 'source': source_path,
                 'destination': dest_path,
-                'hash': file_hash
+                'hash': file_hash,
+                'size': st.st_size
             })
-            
-            # Remove from drop folder after processing
-            source_path.unlink()
-            self.logger.info(f"Removed from drop folder: {source_path.name}")
+            self._dirty.set()
             
         except Exception as e:
             self.logger.error(f"Error processing file {source_path}: {e}")
+            with self._lock:
+                # Let the next check pick the file up again
+                if st is not None:
+                    self._seen_stat.pop((st.st_size, st.st_mtime_ns, st.st_ino), None)
+                if digest is not None:
+                    self.processed_hashes.discard(digest)
+                if dest_path is not None:
+                    self._recent_dests.pop(dest_path, None)
+                if entry is not None:
+                    bucket = self._seen_sizes.get(st.st_size, [])
+                    if entry in bucket:
+                        bucket.remove(entry)
+                        if not bucket:
+                            del self._seen_sizes[st.st_size]
+        finally:
+            with self._lock:
+                self._claimed_sources.discard(source_path)
+    
+    def _dest_path(self, name: str) -> Path:
+        """
+        Vault path for a dropped file.
+        
+        A file of the same name moved in by this watcher less than
+        RECENT_DEST_WINDOW seconds ago is never overwritten (it is likely the
+        first part of the same write); the new file gets a numbered name.
+        """
+        now = time.monotonic()
+        for path, moved_at in list(self._recent_dests.items()):
+            if now - moved_at > RECENT_DEST_WINDOW:
+                del self._recent_dests[path]
+        
+        files = self.vault_path / 'Files'
+        dest_path = files / name
+        stem, suffix = dest_path.stem, dest_path.suffix
+        n = 1
+        while dest_path in self._recent_dests:
+            dest_path = files / f'{stem}_{n}{suffix}'
+            n += 1
+        self._recent_dests[dest_path] = now
+        return dest_path
+    
+    def _action_flusher(self):
+        """Background thread writing queued action files in batches."""
+        while True:
+            items = [self._action_q.get()]
+            # Take whatever else is already queued so a burst is one batch
+            while True:
+                try:
+                    items.append(self._action_q.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                for filepath in self.create_action_files(items):
+                    self.logger.info(f"Created action file: {filepath.name}")
+            except Exception as e:
+                self.logger.error(f"Error writing action files: {e}")
+            finally:
+                for _ in items:
+                    self._action_q.task_done()
+    
+    def wait_until_stable(self, path: Path) -> Optional[os.stat_result]:
+        """
+        Wait until a file has been left unchanged for SETTLE_QUIET seconds.
+        
+        Time since the file's mtime counts towards the quiet period, so
+        files that were finished a while ago return without sleeping.
+        
+        Returns:
+            Final stat result, or None if the file went away or was still
+            changing after SETTLE_TIMEOUT (a later check picks it up)
+        """
+        deadline = time.monotonic() + SETTLE_TIMEOUT
+        try:
+            st = os.stat(path)
+            age = max(0.0, (time.time_ns() - st.st_mtime_ns) / 1e9)
+            quiet_since = time.monotonic() - age
+            while time.monotonic() - quiet_since < SETTLE_QUIET:
+                if time.monotonic() >= deadline:
+                    self.logger.info(f"Still being written, leaving for later: {path.name}")
+                    return None
+                time.sleep(SETTLE_POLL)
+                current = os.stat(path)
+                if (current.st_size, current.st_mtime_ns) != (st.st_size, st.st_mtime_ns):
+                    st, quiet_since = current, time.monotonic()
+        except FileNotFoundError:
+            return None
+        return st
+    
+    def _state_saver(self):
+        """Background thread saving state shortly after each change."""
+        while True:
+            self._dirty.wait()
+            if self._stop.is_set():
+                break
+            # Changes made while saving set the flag again for the next pass
+            self._dirty.clear()
+            self._save_state()
+    
+    def _start_saver(self):
+        """Start the state saver thread."""
+        self._stop.clear()
+        self._saver = threading.Thread(target=self._state_saver, daemon=True)
+        self._saver.start()
+    
+    def _shutdown(self):
+        """Flush queued action files, stop the saver, save state one last time and release the ring."""
+        self._action_q.join()
+        self._stop.set()
+        self._dirty.set()
+        if self._saver is not None:
+            self._saver.join()
+        self._save_state()
+        self._close_ring()
+    
+    def _move_file(self, source_path: Path, dest_path: Path, st: os.stat_result):
+        """
+        Move a dropped file into the vault, copying data only when unavoidable.
+        
+        On the same filesystem (the default vault/Drop layout) this is a
+        rename. Across filesystems the file is copied, then the source removed.
+        An existing file of the same name in the vault is overwritten.
+        """
+        try:
+            # os.replace, unlike os.rename, also overwrites on Windows
+            os.replace(source_path, dest_path)
+            return
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+        
+        self._copy_file(source_path, dest_path, st)
+        source_path.unlink()
+    
+    def _copy_file(self, source_path: Path, dest_path: Path, st: os.stat_result):
+        """Copy via reflink, then in-kernel copy_file_range, then shutil.copy2."""
+        with open(source_path, 'rb') as src, open(dest_path, 'wb') as dst:
+            copied = self._kernel_copy(src.fileno(), dst.fileno(), st.st_size)
+        
+        if copied:
+            os.utime(dest_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        else:
+            shutil.copy2(source_path, dest_path)
+    
+    def _kernel_copy(self, src_fd: int, dst_fd: int, size: int) -> bool:
+        """Copy without moving data through Python; False if the kernel can't."""
+        # Reflink: works across bind mounts of one btrfs/XFS filesystem
+        if FICLONE and fcntl:
+            try:
+                fcntl.ioctl(dst_fd, FICLONE, src_fd)
+                return True
+            except OSError:
+                pass
+        
+        # copy_file_range: zero-copy in the kernel (Linux >= 4.5, cross-fs >= 5.3)
+        if hasattr(os, 'copy_file_range'):
+            try:
+                copied = 0
+                while copied < size:
+                    n = os.copy_file_range(src_fd, dst_fd, size - copied)
+                    if n == 0:
+                        break
+                    copied += n
+                return copied == size
+            except OSError:
+                pass
+        
+        return False
     
     def create_action_file(self, item: dict) -> Optional[Path]:
         """
         Create a .md action file in the Needs_Action folder.
         
         Args:
-            item: Dict with 'source', 'destination', and 'hash' keys
+            item: Dict with 'source', 'destination', 'hash' and 'size' keys
             
         Returns:
             Path to created file, or None if creation failed
@@ -170,78 +806,37 @@ class FileSystemWatcher(BaseWatcher):
         try:
             source_path = item['source']
             dest_path = item['destination']
-            file_hash = item['hash']
+            file_hash = item['hash']  # None when the size was unique
             
-            # Get file metadata
-            file_size = dest_path.stat().st_size
+            # Get file metadata (size comes from the source stat, same bytes)
+            file_size = item.get('size')
+            if file_size is None:
+                file_size = dest_path.stat().st_size
             file_ext = source_path.suffix.lower()
             
             # Determine file type category
-            type_mapping = {
-                '.pdf': 'document',
-                '.doc': 'document',
-                '.docx': 'document',
-                '.txt': 'document',
-                '.md': 'document',
-                '.xls': 'spreadsheet',
-                '.xlsx': 'spreadsheet',
-                '.csv': 'spreadsheet',
-                '.jpg': 'image',
-                '.jpeg': 'image',
-                '.png': 'image',
-                '.gif': 'image',
-                '.zip': 'archive',
-                '.rar': 'archive',
-            }
-            file_type = type_mapping.get(file_ext, 'unknown')
+            file_type = FILE_TYPES.get(file_ext, 'unknown')
+            size_human = self._format_size(file_size)
             
             # Create action file content
             timestamp = self.get_timestamp()
-            content = f"""---
-type: file_drop
-source: {source_path.name}
-destination: {dest_path}
-file_type: {file_type}
-size: {file_size}
-size_human: {self._format_size(file_size)}
-received: {timestamp}
-priority: normal
-status: pending
-hash: {file_hash}
----
-
-# File Drop: {source_path.name}
-
-A new file has been dropped for processing.
-
-## File Details
-
-- **Type**: {file_type}
-- **Size**: {self._format_size(file_size)}
-- **Received**: {timestamp}
-- **Location**: `{dest_path}`
-
-## Suggested Actions
-
-- [ ] Review file content
-- [ ] Categorize appropriately
-- [ ] Take necessary action
-- [ ] Move to archive when complete
-
-## Notes
-
-<!-- Add notes about this file here -->
-
----
-*Created by FileSystemWatcher*
-"""
+            content = ACTION_TEMPLATE.substitute(
+                source=source_path.name,
+                destination=dest_path,
+                file_type=file_type,
+                size=file_size,
+                size_human=size_human,
+                timestamp=timestamp,
+                hash=file_hash or 'null',
+            )
             
             # Create action file
-            safe_name = self.sanitize_filename(source_path.stem)
+            safe_name = self.sanitize_filename(dest_path.stem)
             action_file = self.needs_action / f'FILE_{safe_name}_{timestamp[:10]}.md'
-            action_file.write_text(content)
+            _write_bytes(action_file, content.encode('utf-8'), fsync=self.fsync_action_files)
             
-            self.processed_hashes.add(file_hash)
+            if file_hash:
+                self.processed_hashes.add(bytes.fromhex(file_hash))
             return action_file
             
         except Exception as e:
@@ -250,23 +845,138 @@ A new file has been dropped for processing.
     
     def _format_size(self, size_bytes: int) -> str:
         """Format file size in human-readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024
-        return f"{size_bytes:.1f} TB"
+        # Unit index straight from the bit length: 1024**i <= size < 1024**(i+1)
+        i = min(max(0, (size_bytes.bit_length() - 1) // 10), 4)
+        return f"{size_bytes / (1 << (i * 10)):.1f} {SIZE_UNITS[i]}"
     
     def run(self):
         """
-        Run the watcher using watchdog for real-time monitoring.
+        Run the watcher with real-time monitoring of the drop folder.
+        
+        Uses a single inotify watch on Linux, and the watchdog observer with
+        periodic checks elsewhere or when the drop folder is a network mount.
         """
         self.logger.info(f"Starting {self.__class__.__name__}")
         self.logger.info(f"Vault path: {self.vault_path}")
         self.logger.info(f"Drop folder: {self.drop_folder}")
         
-        # Setup watchdog observer
+        self._start_saver()
+        if INotify is not None and not is_network_fs(self.drop_folder):
+            self._run_inotify()
+        else:
+            self._run_watchdog()
+    
+    def _process_updates(self, label: str):
+        """Run check_for_updates() and process whatever it finds once fully written."""
+        items = self.check_for_updates()
+        if items:
+            self.logger.info(f"{label} found {len(items)} file(s)")
+            for filepath, st, file_hash in items:
+                key = (st.st_size, st.st_mtime_ns, st.st_ino)
+                
+                # The scan may have caught the file mid-write
+                settled = self.wait_until_stable(filepath)
+                if settled is None:
+                    self._seen_stat.pop(key, None)  # retry on the next check
+                    continue
+                if (settled.st_size, settled.st_mtime_ns) != key[:2]:
+                    # Changed since it was hashed
+                    self._seen_stat.pop(key, None)
+                    st, file_hash = settled, None
+                
+                self.process_file(filepath, st, file_hash)
+    
+    def _run_inotify(self):
+        """
+        Event loop on one inotify fd watching only for finished files.
+        
+        CLOSE_WRITE fires once the writer has closed the file and MOVED_TO
+        once a file is renamed in, so no periodic scan is needed. A file is
+        processed once SETTLE_QUIET has passed with no further events for its
+        name, so a writer that closes and reopens it doesn't split it in two.
+        The folder is only rescanned after a queue overflow or a lost watch.
+        """
+        mask = inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO | inotify_flags.MODIFY
+        inotify = None
+        try:
+            inotify = INotify()
+            inotify.add_watch(self.drop_folder, mask)
+        except OSError as e:
+            # e.g. ENOSPC/EMFILE when the inotify watch or instance limit is hit
+            if inotify is not None:
+                inotify.close()
+            self.logger.warning(f"inotify unavailable ({e}) - using watchdog observer")
+            self._run_watchdog()
+            return
+        self.logger.info("inotify watch started - monitoring for file drops")
+        
+        try:
+            # One-shot recovery scan for files dropped while we weren't running
+            rescan = "Startup check"
+            
+            # name -> monotonic time at which it is processed, absent new events
+            pending: Dict[str, float] = {}
+            
+            while True:
+                if rescan:
+                    try:
+                        self._process_updates(rescan)
+                    except Exception as e:
+                        self.logger.error(f"Error in {rescan.lower()}: {e}")
+                    rescan = None
+                
+                # Blocks until files arrive or the next pending file is due;
+                # the saver thread handles state
+                timeout = None
+                if pending:
+                    timeout = max(0.0, min(pending.values()) - time.monotonic()) * 1000
+                for event in inotify.read(timeout=timeout):
+                    if event.mask & inotify_flags.Q_OVERFLOW:
+                        # Events were dropped: find the files by scanning instead
+                        self.logger.warning("inotify queue overflowed")
+                        rescan = "Overflow rescan"
+                        continue
+                    if event.mask & (inotify_flags.IGNORED | inotify_flags.UNMOUNT):
+                        # The watch is gone (folder deleted, moved or unmounted)
+                        self.logger.warning("inotify watch on drop folder removed - re-adding")
+                        try:
+                            self.drop_folder.mkdir(parents=True, exist_ok=True)
+                            inotify.add_watch(self.drop_folder, mask)
+                        except OSError as e:
+                            self.logger.error(f"Could not re-add inotify watch: {e}")
+                            return
+                        rescan = "Rewatch check"
+                        continue
+                    # Kernel-generated events like the above have no name
+                    if not event.name or event.mask & inotify_flags.ISDIR or event.name.startswith('.'):
+                        continue
+                    # Writes only postpone files already closed once; a file
+                    # still being written for the first time waits for its close
+                    if event.mask & inotify_flags.MODIFY and event.name not in pending:
+                        continue
+                    pending[event.name] = time.monotonic() + SETTLE_QUIET
+                
+                now = time.monotonic()
+                for name in [name for name, due in pending.items() if due <= now]:
+                    del pending[name]
+                    self.logger.info(f"File detected: {name}")
+                    self.process_file(self.drop_folder / name)
+                
+        except KeyboardInterrupt:
+            self.logger.info("Watcher stopped by user")
+        except Exception as e:
+            self.logger.error(f"Fatal error: {e}", exc_info=True)
+            raise
+        finally:
+            inotify.close()
+            self._shutdown()
+    
+    def _run_watchdog(self):
+        """Watchdog observer plus periodic checks in case it misses something."""
+        # Setup watchdog observer (polling on network mounts, which don't
+        # deliver native events for remote writes)
         event_handler = FileDropHandler(self)
-        observer = Observer()
+        observer = make_observer([self.drop_folder], DROP_POLL_INTERVAL)
         observer.schedule(event_handler, str(self.drop_folder), recursive=False)
         observer.start()
         
@@ -276,15 +986,7 @@ A new file has been dropped for processing.
             while True:
                 # Also do periodic checks in case watchdog misses something
                 try:
-                    items = self.check_for_updates()
-                    if items:
-                        self.logger.info(f"Periodic check found {len(items)} file(s)")
-                        for item in items:
-                            self.process_file(item)
-                    
-                    # Save state
-                    self._save_state()
-                    
+                    self._process_updates("Periodic check")
                 except Exception as e:
                     self.logger.error(f"Error in periodic check: {e}")
                 
@@ -292,16 +994,13 @@ A new file has been dropped for processing.
                 
         except KeyboardInterrupt:
             self.logger.info("Watcher stopped by user")
-            observer.stop()
-            self._save_state()
         except Exception as e:
             self.logger.error(f"Fatal error: {e}", exc_info=True)
-            observer.stop()
-            self._save_state()
             raise
         finally:
+            observer.stop()
             observer.join()
-
+            self._shutdown()
 
 if __name__ == "__main__":
     # Parse command line arguments